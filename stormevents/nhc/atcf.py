@@ -1,9 +1,15 @@
+import csv
 import ftplib
 import io
 import itertools
+import logging
+import os
+import tempfile
 from collections.abc import Iterable
 from datetime import datetime
+from datetime import timedelta
 from enum import Enum
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 from typing import List
@@ -11,6 +17,7 @@ from typing import TextIO
 from typing import Union
 
 import geopandas
+import numpy
 import pandas
 import typepigeon
 from geopandas import GeoDataFrame
@@ -20,6 +27,12 @@ from pandas import Series
 from stormevents.nhc.storms import nhc_storms
 
 ATCF_RECORD_START_YEAR = 1850
+ATCF_FTP_HOSTNAME = "ftp.nhc.noaa.gov"
+
+# set to `1` (or to a directory path) to cache parsed ATCF data on disk
+ATCF_CACHE_VARIABLE = "STORMEVENTS_CACHE"
+# cached remote ATCF data is refreshed after this time, since realtime files are updated with every advisory
+ATCF_CACHE_LIFETIME = timedelta(hours=1)
 
 # suppress `SettingWithCopyWarning`
 pandas.options.mode.chained_assignment = None
@@ -137,12 +150,23 @@ EXTRA_ATCF_FIELDS = {
 
 def atcf_files(
     file_deck: "ATCF_FileDeck" = None, mode: "ATCF_Mode" = None, year: int = None
+) -> List[str]:
+    # list every requested directory over a single login, rather than connecting again for each deck, mode, and year
+    with ftplib.FTP(ATCF_FTP_HOSTNAME, "anonymous", "") as ftp:
+        return _atcf_files(ftp, file_deck=file_deck, mode=mode, year=year)
+
+
+def _atcf_files(
+    ftp: ftplib.FTP,
+    file_deck: "ATCF_FileDeck" = None,
+    mode: "ATCF_Mode" = None,
+    year: int = None,
 ) -> List[str]:
     if file_deck is None:
         return list(
             itertools.chain(
                 *(
-                    atcf_files(file_deck=file_deck.value, mode=mode, year=year)
+                    _atcf_files(ftp, file_deck=file_deck.value, mode=mode, year=year)
                     for file_deck in ATCF_FileDeck
                 )
             )
@@ -152,7 +176,7 @@ def atcf_files(
         return list(
             itertools.chain(
                 *(
-                    atcf_files(file_deck=file_deck, mode=mode.value, year=year)
+                    _atcf_files(ftp, file_deck=file_deck, mode=mode.value, year=year)
                     for mode in ATCF_Mode
                 )
             )
@@ -170,15 +194,14 @@ def atcf_files(
         return list(
             itertools.chain(
                 *(
-                    atcf_files(file_deck=file_deck, mode=mode, year=entry)
+                    _atcf_files(ftp, file_deck=file_deck, mode=mode, year=entry)
                     for entry in year
                 )
             )
         )
 
     url = atcf_url(file_deck=file_deck, mode=mode, year=year)
-    hostname, directory = url.split("/", 3)[2:]
-    ftp = ftplib.FTP(hostname.replace("ftp://", ""), "anonymous", "")
+    directory = url.split("/", 3)[3]
 
     filenames = [
         filename
@@ -224,6 +247,19 @@ def get_atcf_entry(
     basin: str = None,
     storm_number: int = None,
     storm_name: str = None,
+) -> Series:
+    # the same storm is looked up repeatedly while resolving tracks and URLs; hand out a copy of the cached entry
+    return _atcf_entry(
+        year=year, basin=basin, storm_number=storm_number, storm_name=storm_name
+    ).copy()
+
+
+@lru_cache(maxsize=None)
+def _atcf_entry(
+    year: int,
+    basin: str = None,
+    storm_number: int = None,
+    storm_name: str = None,
 ) -> Series:
     storms = nhc_storms(year=year)
 
@@ -305,7 +341,7 @@ def atcf_url(
         else:
             raise NotImplementedError(f'filedeck "{file_deck}" is not implemented')
 
-    url = f"ftp://ftp.nhc.noaa.gov/atcf/{nhc_dir}/"
+    url = f"ftp://{ATCF_FTP_HOSTNAME}/atcf/{nhc_dir}/"
 
     if nhc_code is not None:
         url += f"{file_deck.value}{nhc_code.lower()}{suffix}"
@@ -313,17 +349,97 @@ def atcf_url(
     return url
 
 
+def atcf_cache_directory() -> Union[Path, None]:
+    """
+    directory to cache parsed ATCF data in; caching is disabled unless the ``STORMEVENTS_CACHE`` environment variable is set
+    to ``1`` (uses ``~/.cache/stormevents``) or to a directory path
+
+    :return: path to cache directory, or ``None`` if caching is disabled
+    """
+
+    value = os.environ.get(ATCF_CACHE_VARIABLE, "").strip()
+    if value.lower() in ("", "0", "false", "no"):
+        return None
+    elif value.lower() in ("1", "true", "yes"):
+        cache_root = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+        return Path(cache_root) / "stormevents"
+    else:
+        return Path(value)
+
+
+def read_atcf_cache(key: str, max_age: timedelta = None) -> Union[GeoDataFrame, None]:
+    """
+    read parsed ATCF data from the cache
+
+    :param key: name of cache entry
+    :param max_age: ignore entries older than this
+    :return: cached data frame, or ``None`` if caching is disabled or no valid entry exists
+    """
+
+    cache_directory = atcf_cache_directory()
+    if cache_directory is None:
+        return None
+
+    path = cache_directory / f"{key}.pkl"
+    try:
+        if max_age is not None:
+            modified = datetime.fromtimestamp(path.stat().st_mtime)
+            if datetime.now() - modified > max_age:
+                return None
+        return pandas.read_pickle(path)
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        # truncated entries raise `pickle.UnpicklingError`, and entries written with other versions of the dependencies
+        # can raise nearly anything, so treat every entry that cannot be loaded as missing
+        logging.warning(f'ignoring unreadable cached ATCF data "{path}": {error}')
+        return None
+
+
+def write_atcf_cache(key: str, data: DataFrame):
+    """
+    write parsed ATCF data to the cache, if caching is enabled
+
+    :param key: name of cache entry
+    :param data: parsed ATCF data
+    """
+
+    cache_directory = atcf_cache_directory()
+    if cache_directory is None:
+        return
+
+    temporary_filename = None
+    try:
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file in the same directory and move it into place,
+        # so that an interrupted or concurrent write never leaves a partial entry
+        with tempfile.NamedTemporaryFile(
+            dir=cache_directory, prefix=f"{key}.", suffix=".tmp", delete=False
+        ) as temporary_file:
+            temporary_filename = temporary_file.name
+            data.to_pickle(temporary_file)
+        os.replace(temporary_filename, cache_directory / f"{key}.pkl")
+    except OSError as error:
+        logging.warning(f'could not cache ATCF data in "{cache_directory}": {error}')
+        if temporary_filename is not None and os.path.exists(temporary_filename):
+            os.remove(temporary_filename)
+
+
 def read_atcf(
-    atcf: Union[PathLike, io.BytesIO, TextIO],
+    atcf: Union[PathLike, io.BytesIO, TextIO, DataFrame],
     advisories: List[ATCF_Advisory] = None,
     fort_22: bool = False,
+    start_date: datetime = None,
+    end_date: datetime = None,
 ) -> GeoDataFrame:
     """
     read ATCF format
 
-    :param atcf: path or buffered reader
+    :param atcf: path, buffered reader, or data frame that was already parsed
     :param advisories: allowed advisory types
     :param fort_22: whether to parse `fort.22` fields
+    :param start_date: skip records before this time
+    :param end_date: skip records after this time
     :return: data frame of parsed ATCF data
     """
 
@@ -332,20 +448,66 @@ def read_atcf(
             typepigeon.convert_value(advisory, str) for advisory in advisories
         ]
 
+    if isinstance(atcf, DataFrame):
+        # parsed data only needs to be filtered
+        data = atcf
+        if advisories is not None and len(advisories) > 0:
+            data = data[data["advisory"].isin(advisories)]
+            if len(data) == 0:
+                raise ValueError(f'no ATCF records found matching "{advisories}"')
+        if start_date is not None:
+            data = data[data["datetime"] >= pandas.Timestamp(start_date)]
+        if end_date is not None:
+            data = data[data["datetime"] <= pandas.Timestamp(end_date)]
+        return data
+
     if isinstance(atcf, (str, PathLike, Path)):
         atcf = open(atcf)
 
-    lines = (str(line, "UTF-8") if isinstance(line, bytes) else line for line in atcf)
-    lines = (
-        (
-            entry.strip()
-            for entry in line.split(",", maxsplit=len(ATCF_FIELDS) - 1)
-            if ~pandas.isna(line)
+    content = atcf.read()
+    if isinstance(content, bytes):
+        content = str(content, "UTF-8")
+    lines = [line for line in content.splitlines() if len(line.strip()) > 0]
+
+    if len(lines) > 0:
+        # number of fields actually present on each line; short rows leave the remaining fields missing
+        field_counts = numpy.fromiter(
+            (line.count(",") + 1 for line in lines), dtype=int, count=len(lines)
         )
-        for line in lines
-    )
+        num_fields = field_counts.max()
+
+        data = pandas.read_csv(
+            io.StringIO("\n".join(lines)),
+            header=None,
+            names=range(num_fields),
+            dtype=str,
+            na_filter=False,
+            quoting=csv.QUOTE_NONE,
+            skipinitialspace=True,
+        )
+        for column in data.columns:
+            data[column] = data[column].str.strip()
+
+        num_atcf_fields = len(ATCF_FIELDS)
+        if num_fields > num_atcf_fields:
+            # join any overflow into the last (user-defined) field, as splitting with `maxsplit` would
+            last_field = num_atcf_fields - 1
+            overflow = data[last_field].str.cat(
+                [data[column] for column in range(num_atcf_fields, num_fields)],
+                sep=",",
+            )
+            data[last_field] = overflow.where(
+                field_counts > num_atcf_fields, data[last_field]
+            )
+            data = data.iloc[:, :num_atcf_fields]
+            field_counts = numpy.minimum(field_counts, num_atcf_fields)
+
+        data = data.where(
+            numpy.arange(len(data.columns))[None, :] < field_counts[:, None], None
+        )
+    else:
+        data = DataFrame()
 
-    data = DataFrame.from_records(lines)
     data.rename(
         columns={index: list(ATCF_FIELDS)[index] for index in range(len(data.columns))},
         inplace=True,
@@ -397,22 +559,20 @@ def read_atcf(
     data.loc[~best_track_records, "YYYYMMDDHH"] += "00"
     data["YYYYMMDDHH"] = pandas.to_datetime(data["YYYYMMDDHH"], format="%Y%m%d%H%M")
 
-    data.loc[data["LatN/S"].str.endswith("N"), "LatN/S"] = data["LatN/S"].str.strip("N")
-    data.loc[data["LatN/S"].str.endswith("S"), "LatN/S"] = "-" + data[
-        "LatN/S"
-    ].str.strip("S")
-
-    data.loc[data["LonE/W"].str.endswith("E"), "LonE/W"] = data["LonE/W"].str.strip("E")
-    data.loc[data["LonE/W"].str.endswith("W"), "LonE/W"] = "-" + data[
-        "LonE/W"
-    ].str.strip("W")
-
-    data[["LatN/S", "LonE/W"]] = (
-        data[["LatN/S", "LonE/W"]].astype(
-            {"LatN/S": float, "LonE/W": float}, copy=False
-        )
-        / 10
-    )
+    # drop records outside the time window before converting the remaining fields
+    if start_date is not None:
+        data = data[data["YYYYMMDDHH"] >= pandas.Timestamp(start_date)]
+    if end_date is not None:
+        data = data[data["YYYYMMDDHH"] <= pandas.Timestamp(end_date)]
+
+    # coordinates are given in tenths of a degree, with a trailing hemisphere letter
+    for field, hemisphere_signs in {
+        "LatN/S": {"N": 1, "S": -1},
+        "LonE/W": {"E": 1, "W": -1},
+    }.items():
+        signs = data[field].str[-1].map(hemisphere_signs)
+        values = data[field].where(signs.isna(), data[field].str[:-1])
+        data[field] = values.astype(float) * signs.fillna(1).astype(float) / 10
 
     if pandas.isna(data["RAD"]).any():
         raise ValueError(
@@ -447,13 +607,10 @@ def read_atcf(
         if field in data.columns
     ]
 
-    for float_field in float_fields:
-        data.loc[
-            (data[float_field].str.len() == 0) | pandas.isna(data[float_field]),
-            float_field,
-        ] = "NaN"
-
-    data[float_fields] = data[float_fields].astype(float, copy=False)
+    # empty and missing fields become NaN
+    data[float_fields] = (
+        data[float_fields].apply(pandas.to_numeric, errors="coerce").astype(float)
+    )
 
     data.rename(
         columns={
@@ -1,37 +1,40 @@
 import gzip
+import hashlib
 import io
 import logging
+import os
 import pathlib
-import re
 import warnings
 from datetime import datetime
 from datetime import timedelta
-from functools import partial
 from os import PathLike
-from typing import Any
 from typing import Dict
 from typing import List
+from typing import NamedTuple
+from typing import Tuple
 from typing import Union
 from urllib.error import URLError
 from urllib.request import urlopen
 
 import numpy
 import pandas
+import shapely
 import typepigeon
 from pandas import DataFrame, Timedelta
 from pyproj import Geod
-from shapely import ops
 from shapely.geometry import LineString
-from shapely.geometry import MultiPolygon
 from shapely.geometry import Polygon
 
 from stormevents.nhc.atcf import ATCF_Advisory
+from stormevents.nhc.atcf import ATCF_CACHE_LIFETIME
 from stormevents.nhc.atcf import ATCF_FileDeck
 from stormevents.nhc.atcf import ATCF_Mode
 from stormevents.nhc.atcf import atcf_url
 from stormevents.nhc.atcf import EXTRA_ATCF_FIELDS
 from stormevents.nhc.atcf import get_atcf_entry
 from stormevents.nhc.atcf import read_atcf
+from stormevents.nhc.atcf import read_atcf_cache
+from stormevents.nhc.atcf import write_atcf_cache
 from stormevents.nhc.storms import nhc_storms
 from stormevents.nhc.const import (
     get_RMW_regression_coefs,
@@ -41,6 +44,54 @@ from stormevents.nhc.const import (
 from stormevents.utilities import subset_time_interval
 
 
+class _TrackConfiguration(NamedTuple):
+    """
+    settings that determine which ATCF data is read for a track; compared on every data access to detect changes
+    """
+
+    id: str
+    file_deck: ATCF_FileDeck
+    advisories: Tuple[Union[str, ATCF_Advisory], ...]
+    filename: pathlib.Path
+    rmw_fill: RMWFillMethod
+
+
+# WGS84 ellipsoid, shared by every track rather than set up for each computation
+WGS84 = Geod(ellps="WGS84")
+
+# translation table that deletes ASCII digits from a string
+_REMOVE_DIGITS = str.maketrans("", "", "0123456789")
+
+# widths of fields written as padded text by `VortexTrack.atcf`
+ATCF_FIELD_WIDTHS = {
+    "storm_number": 3,
+    "forecast_hours": 4,
+    "max_sustained_wind_speed": 4,
+    "isotach_radius": 4,
+    "isotach_radius_for_NEQ": 5,
+    "isotach_radius_for_SEQ": 5,
+    "isotach_radius_for_SWQ": 5,
+    "isotach_radius_for_NWQ": 5,
+    "central_pressure": 5,
+    "background_pressure": 5,
+    "radius_of_last_closed_isobar": 5,
+    "radius_of_maximum_winds": 4,
+    "gust_speed": 4,
+    "eye_diameter": 4,
+    "maximum_wave_height": 4,
+    "direction": 4,
+    "speed": 4,
+    "name": 11,
+    "depth_code": 2,
+    "isowave": 3,
+    "isowave_quadrant_code": 4,
+    "isowave_radius_for_NEQ": 5,
+    "isowave_radius_for_SEQ": 5,
+    "isowave_radius_for_SWQ": 5,
+    "isowave_radius_for_NWQ": 5,
+}
+
+
 class VortexTrack:
     """
     interface to an ATCF vortex track (i.e. HURDAT, best track, HWRF, etc.)
@@ -78,6 +129,7 @@ class VortexTrack:
         """
 
         self.__unfiltered_data = None
+        self.__unfiltered_data_valid = False
         self.__filename = None
 
         self.__remote_atcf = None
@@ -91,13 +143,15 @@ class VortexTrack:
 
         self.__advisories_to_remove = []
         self.__invalid_storm_name = False
-        self.__location_hash = None
+        self.__locations = None
         self.__linestrings = None
         self.__distances = None
+        self.__data_mask = None
+        self.__duration = None
 
         if isinstance(storm, DataFrame):
             self.__unfiltered_data = storm
-        elif pathlib.Path(storm).exists():
+        elif isinstance(storm, (str, PathLike)) and os.path.isfile(storm):
             self.filename = storm
         elif isinstance(storm, str):
             try:
@@ -211,7 +265,7 @@ class VortexTrack:
 
         if self.__name is None:
             # get the most frequently-used storm name in the data
-            names = self.data["name"].value_counts()
+            names = self.__data_column("name").value_counts()
             if len(names) > 0:
                 name = names.index[0]
             else:
@@ -237,7 +291,7 @@ class VortexTrack:
         'AL'
         """
 
-        return self.data["basin"].iloc[0]
+        return self.__data_column("basin").iloc[0]
 
     @property
     def storm_number(self) -> str:
@@ -249,7 +303,7 @@ class VortexTrack:
         11
         """
 
-        return self.data["storm_number"].iloc[0]
+        return self.__data_column("storm_number").iloc[0]
 
     @property
     def year(self) -> int:
@@ -261,7 +315,7 @@ class VortexTrack:
         2017
         """
 
-        return self.data["datetime"].iloc[0].year
+        return self.__data_column("datetime").iloc[0].year
 
     @property
     def nhc_code(self) -> str:
@@ -297,7 +351,7 @@ class VortexTrack:
     def nhc_code(self, nhc_code: str):
         if nhc_code is not None:
             # check if name+year was given instead of basin+number+year
-            digits = sum([1 for character in nhc_code if character.isdigit()])
+            digits = len(nhc_code) - len(nhc_code.translate(_REMOVE_DIGITS))
 
             if digits == 4:
                 atcf_nhc_code = get_atcf_entry(
@@ -348,6 +402,10 @@ class VortexTrack:
                 start_date = pandas.to_datetime(start_date)
 
         self.__start_date = start_date
+        self.__data_mask = None
+        self.__duration = None
+        self.__linestrings = None
+        self.__distances = None
 
     @property
     def end_date(self) -> pandas.Timestamp:
@@ -389,6 +447,10 @@ class VortexTrack:
                 end_date = pandas.to_datetime(end_date)
 
         self.__end_date = end_date
+        self.__data_mask = None
+        self.__duration = None
+        self.__linestrings = None
+        self.__distances = None
 
     @property
     def forecast_time(self) -> pandas.Timestamp:
@@ -415,6 +477,10 @@ class VortexTrack:
             #     )
 
         self.__forecast_time = forecast_time
+        self.__data_mask = None
+        self.__duration = None
+        self.__linestrings = None
+        self.__distances = None
 
     @property
     def file_deck(self) -> ATCF_FileDeck:
@@ -549,16 +615,51 @@ class VortexTrack:
         [10434 rows x 38 columns]
         """
 
-        if self.forecast_time is not None:
-            return self.unfiltered_data.loc[
-                (self.unfiltered_data["track_start_time"] == self.forecast_time)
-                & (self.unfiltered_data["datetime"] >= self.start_date)
-                & (self.unfiltered_data["datetime"] <= self.end_date)
-            ]
-        return self.unfiltered_data.loc[
-            (self.unfiltered_data["datetime"] >= self.start_date)
-            & (self.unfiltered_data["datetime"] <= self.end_date)
-        ]
+        unfiltered_data = self.unfiltered_data
+        data_mask = self.__current_data_mask(unfiltered_data)
+        data = unfiltered_data.iloc[data_mask]
+        if isinstance(data_mask, slice):
+            # a slice shares memory with the unfiltered data, which should not be edited through this frame
+            data = data.copy()
+        return data
+
+    def __current_data_mask(
+        self, unfiltered_data: DataFrame
+    ) -> Union[slice, numpy.ndarray]:
+        """
+        :param unfiltered_data: current unfiltered data
+        :return: positions of records within the current time bounds and forecast time, as a slice if they are contiguous or as a boolean mask
+        """
+
+        # the mask is reset whenever the data or the time bounds are set
+        if self.__data_mask is None:
+            datetimes = unfiltered_data["datetime"]
+            if self.forecast_time is None and datetimes.is_monotonic_increasing:
+                # records are sorted by time when read, so the time bounds select a contiguous range
+                self.__data_mask = slice(
+                    datetimes.searchsorted(self.start_date, side="left"),
+                    datetimes.searchsorted(self.end_date, side="right"),
+                )
+            else:
+                data_mask = (datetimes >= self.start_date) & (
+                    datetimes <= self.end_date
+                )
+                if self.forecast_time is not None:
+                    data_mask &= (
+                        unfiltered_data["track_start_time"] == self.forecast_time
+                    )
+                self.__data_mask = data_mask.values
+
+        return self.__data_mask
+
+    def __data_column(self, column: str) -> pandas.Series:
+        """
+        :param column: name of data column
+        :return: single column of the filtered data, without copying the other columns
+        """
+
+        unfiltered_data = self.unfiltered_data
+        return unfiltered_data[column].iloc[self.__current_data_mask(unfiltered_data)]
 
     def to_file(
         self, path: PathLike, advisory: ATCF_Advisory = None, overwrite: bool = False
@@ -601,6 +702,8 @@ class VortexTrack:
             atcf["advisory"] != "BEST", "track_start_time"
         ]
         atcf.drop(columns=["geometry", "track_start_time"], inplace=True)
+        # without geometry, the output is a plain data frame
+        atcf = DataFrame(atcf)
 
         if advisory is not None:
             if isinstance(advisory, ATCF_Advisory):
@@ -613,18 +716,15 @@ class VortexTrack:
 
         float_columns = atcf.select_dtypes(include=["float"]).columns
         integer_na_value = -99999
-        for column in float_columns:
-            atcf.loc[pandas.isna(atcf[column]), column] = integer_na_value
-            # Due to update in pandas 2
-            atcf.loc[:, column] = atcf.loc[:, column].round(0)
-        atcf = atcf.astype({col: int for col in float_columns})
+        # round all float columns as one block, marking missing values
+        atcf[float_columns] = (
+            atcf[float_columns].fillna(integer_na_value).round(0).astype(int)
+        )
 
         atcf["basin"] = atcf["basin"].str.pad(2)
-        atcf["storm_number"] = atcf["storm_number"].astype("string").str.pad(3)
         atcf["datetime"] = atcf["datetime"].dt.strftime("%Y%m%d%H").str.pad(11)
         atcf["advisory_number"] = atcf["advisory_number"].str.pad(3)
         atcf["advisory"] = atcf["advisory"].str.pad(5)
-        atcf["forecast_hours"] = atcf["forecast_hours"].astype("string").str.pad(4)
 
         atcf["latitude"] = atcf["latitude"].astype("string")
         atcf.loc[~atcf["latitude"].str.contains("-"), "latitude"] = (
@@ -644,83 +744,31 @@ class VortexTrack:
         )
         atcf["longitude"] = atcf["longitude"].str.strip("-").str.pad(6)
 
-        atcf["max_sustained_wind_speed"] = (
-            atcf["max_sustained_wind_speed"].astype("string").str.pad(4)
-        )
         atcf["development_level"] = atcf["development_level"].str.pad(3)
-        atcf["isotach_radius"] = atcf["isotach_radius"].astype("string").str.pad(4)
         atcf["isotach_quadrant_code"] = atcf["isotach_quadrant_code"].str.pad(4)
-        atcf["isotach_radius_for_NEQ"] = (
-            atcf["isotach_radius_for_NEQ"].astype("string").str.pad(5)
-        )
-        atcf["isotach_radius_for_SEQ"] = (
-            atcf["isotach_radius_for_SEQ"].astype("string").str.pad(5)
-        )
-        atcf["isotach_radius_for_SWQ"] = (
-            atcf["isotach_radius_for_SWQ"].astype("string").str.pad(5)
-        )
-        atcf["isotach_radius_for_NWQ"] = (
-            atcf["isotach_radius_for_NWQ"].astype("string").str.pad(5)
-        )
-
-        atcf["background_pressure"] = atcf["background_pressure"].ffill().astype(int)
-        atcf["central_pressure"] = atcf["central_pressure"].astype(int)
-
-        press_cond_nobg = ~atcf["central_pressure"].isna() & (
-            (atcf["background_pressure"] <= atcf["central_pressure"])
-            | (atcf["background_pressure"].isna())
-        )
-        atcf.loc[press_cond_nobg, "background_pressure"] = 1013
 
-        press_cond_nobg_hieye = press_cond_nobg & (atcf["central_pressure"] >= 1013)
-        atcf.loc[press_cond_nobg_hieye, "background_pressure"] = (
-            atcf.loc[press_cond_nobg_hieye, "central_pressure"] + 1
-        )
-        atcf["central_pressure"] = atcf["central_pressure"].astype("string").str.pad(5)
-        atcf["background_pressure"] = (
-            atcf["background_pressure"].astype("string").str.pad(5)
-        )
+        background_pressure = atcf["background_pressure"].ffill().astype(int).values
+        central_pressure = atcf["central_pressure"].astype(int).values
 
-        atcf["radius_of_last_closed_isobar"] = (
-            atcf["radius_of_last_closed_isobar"].astype("string").str.pad(5)
-        )
-        atcf["radius_of_maximum_winds"] = (
-            atcf["radius_of_maximum_winds"].astype("string").str.pad(4)
+        # background pressure must exceed central pressure; default to 1013, or just above a high central pressure
+        press_cond_nobg = background_pressure <= central_pressure
+        atcf["background_pressure"] = numpy.where(
+            press_cond_nobg,
+            numpy.where(central_pressure >= 1013, central_pressure + 1, 1013),
+            background_pressure,
         )
-        atcf["gust_speed"] = atcf["gust_speed"].astype("string").str.pad(4)
-        atcf["eye_diameter"] = atcf["eye_diameter"].astype("string").str.pad(4)
+        atcf["central_pressure"] = central_pressure
         atcf["subregion_code"] = atcf["subregion_code"].str.pad(4)
-        atcf["maximum_wave_height"] = (
-            atcf["maximum_wave_height"].astype("string").str.pad(4)
-        )
         atcf["forecaster_initials"] = atcf["forecaster_initials"].str.pad(4)
 
-        atcf["direction"] = atcf["direction"].astype("string").str.pad(4)
-        atcf["speed"] = atcf["speed"].astype("string").str.pad(4)
-        atcf["name"] = atcf["name"].astype("string").str.pad(11)
-
-        if "depth_code" in atcf.columns:
-            atcf["depth_code"] = atcf["depth_code"].astype("string").str.pad(2)
-            atcf["isowave"] = atcf["isowave"].astype("string").str.pad(3)
-            atcf["isowave_quadrant_code"] = (
-                atcf["isowave_quadrant_code"].astype("string").str.pad(4)
-            )
-            atcf["isowave_radius_for_NEQ"] = (
-                atcf["isowave_radius_for_NEQ"].astype("string").str.pad(5)
-            )
-            atcf["isowave_radius_for_SEQ"] = (
-                atcf["isowave_radius_for_SEQ"].astype("string").str.pad(5)
-            )
-            atcf["isowave_radius_for_SWQ"] = (
-                atcf["isowave_radius_for_SWQ"].astype("string").str.pad(5)
-            )
-            atcf["isowave_radius_for_NWQ"] = (
-                atcf["isowave_radius_for_NWQ"].astype("string").str.pad(5)
-            )
+        # format the remaining fields as text of their fixed ATCF widths
+        for column, width in ATCF_FIELD_WIDTHS.items():
+            if column in atcf.columns:
+                atcf[column] = atcf[column].astype("string").str.pad(width)
 
         for column in atcf.select_dtypes(include=["string"]).columns:
             atcf[column] = atcf[column].str.replace(
-                re.compile(str(integer_na_value)), "", regex=True
+                str(integer_na_value), "", regex=False
             )
 
         return atcf
@@ -742,16 +790,18 @@ class VortexTrack:
             inplace=True,
         )
 
+        # number records by their unique datetime, in chronological order
+        data = self.data
+        record_numbers, _ = pandas.factorize(data["datetime"], sort=True)
         fort22["record_number"] = (
-            (self.data.groupby(["datetime"]).ngroup() + 1).astype("string").str.pad(4)
+            pandas.Series(record_numbers + 1, index=data.index)
+            .astype("string")
+            .str.pad(4)
         )
 
         if advisory == ATCF_Advisory.BEST or advisory == ATCF_Advisory.BEST.value:
             fort22["forecast_hours"] = (
-                (
-                    (self.data["datetime"] - self.data["datetime"].iloc[0])
-                    / Timedelta("1 hour")
-                )
+                ((data["datetime"] - data["datetime"].iloc[0]) / Timedelta("1 hour"))
                 .astype(int)
                 .astype("string")
                 .str.pad(4)
@@ -775,18 +825,33 @@ class VortexTrack:
         ):
             tracks = self.tracks
 
-            linestrings = {}
+            linestrings = {advisory: {} for advisory in tracks}
+
+            keys = []
+            track_coordinates = []
             for advisory, advisory_tracks in tracks.items():
-                linestrings[advisory] = {}
                 for track_start_time, track in advisory_tracks.items():
                     geometries = track["geometry"]
                     if len(geometries) > 1:
                         geometries = geometries.drop_duplicates()
                         if len(geometries) > 1:
-                            linestrings[advisory][track_start_time] = LineString(
-                                geometries.to_list()
+                            keys.append((advisory, track_start_time))
+                            track_coordinates.append(
+                                shapely.get_coordinates(numpy.asarray(geometries))
                             )
 
+            if len(keys) > 0:
+                # construct every linestring from a single coordinate array
+                track_lengths = [len(coordinates) for coordinates in track_coordinates]
+                for (advisory, track_start_time), linestring in zip(
+                    keys,
+                    shapely.linestrings(
+                        numpy.concatenate(track_coordinates),
+                        indices=numpy.repeat(numpy.arange(len(keys)), track_lengths),
+                    ),
+                ):
+                    linestrings[advisory][track_start_time] = linestring
+
             self.__linestrings = linestrings
 
         return self.__linestrings
@@ -805,22 +870,43 @@ class VortexTrack:
             or len(self.__distances) == 0
             or configuration != self.__previous_configuration
         ):
-            geodetic = Geod(ellps="WGS84")
-
             linestrings = self.linestrings
 
-            distances = {}
-            for advisory, advisory_tracks in linestrings.items():
-                distances[advisory] = {}
-                for track_start_time, linestring in advisory_tracks.items():
-                    x, y = linestring.xy
-                    _, _, track_distances = geodetic.inv(
-                        x[:-1],
-                        y[:-1],
-                        x[1:],
-                        y[1:],
-                    )
-                    distances[advisory][track_start_time] = numpy.sum(track_distances)
+            keys = [
+                (advisory, track_start_time)
+                for advisory, advisory_tracks in linestrings.items()
+                for track_start_time in advisory_tracks
+            ]
+            distances = {advisory: {} for advisory in linestrings}
+
+            if len(keys) > 0:
+                # measure the segments of every track in a single call, over all coordinates end to end
+                coordinates, track_indices = shapely.get_coordinates(
+                    [linestrings[advisory][track] for advisory, track in keys],
+                    return_index=True,
+                )
+                segment_distances = WGS84.line_lengths(
+                    lons=coordinates[:, 0], lats=coordinates[:, 1]
+                )
+                # discard segments that join the end of one track to the start of the next
+                segment_distances[track_indices[:-1] != track_indices[1:]] = 0
+                cumulative_distances = numpy.concatenate(
+                    [[0], numpy.cumsum(segment_distances)]
+                )
+
+                track_starts = numpy.searchsorted(
+                    track_indices, numpy.arange(len(keys))
+                )
+                track_ends = numpy.append(track_starts[1:], len(track_indices)) - 1
+                track_distances = (
+                    cumulative_distances[track_ends]
+                    - cumulative_distances[track_starts]
+                )
+
+                for (advisory, track_start_time), track_distance in zip(
+                    keys, track_distances
+                ):
+                    distances[advisory][track_start_time] = track_distance
 
             self.__distances = distances
 
@@ -856,7 +942,8 @@ class VortexTrack:
         # convert quadrant radii from nautical miles to meters
         data[quadrant_names] *= 1852.0
 
-        geodetic = Geod(ellps="WGS84")
+        # angles spanned by a quadrant, relative to its starting angle
+        quadrant_angles = numpy.linspace(0, 90, segments)
 
         tracks = separate_tracks(data)
 
@@ -865,58 +952,68 @@ class VortexTrack:
         for advisory, advisory_tracks in tracks.items():
             advisory_isotachs = {}
             for track_start_time, track_data in advisory_tracks.items():
-                track_isotachs = {}
-                for index, row in track_data.iterrows():
-                    # get the starting angle range for NEQ based on storm direction
-                    rotation_angle = 360 - row["direction"]
-                    start_angle = 0 + rotation_angle
-                    end_angle = 90 + rotation_angle
-
-                    # append quadrants in clockwise direction from NEQ
-                    quadrants = []
-                    for quadrant_name in quadrant_names:
-                        # skip if quadrant radius is zero
-                        if row[quadrant_name] > 1:
-                            # enter the angle range for this quadrant
-                            theta = numpy.linspace(start_angle, end_angle, segments)
-
-                            # move angle to next quadrant
-                            start_angle = start_angle + 90
-                            end_angle = end_angle + 90
-
-                            # make the coordinate list for this quadrant using forward geodetic (origin,angle,dist)
-                            vectorized_forward_geodetic = numpy.vectorize(
-                                partial(
-                                    geodetic.fwd,
-                                    lons=row["longitude"],
-                                    lats=row["latitude"],
-                                    dist=row[quadrant_name],
-                                )
-                            )
-                            x, y, reverse_azimuth = vectorized_forward_geodetic(
-                                az=theta
-                            )
-                            vertices = numpy.stack([x, y], axis=1)
-
-                            # insert center point at beginning and end of list
-                            vertices = numpy.concatenate(
-                                [
-                                    row[["longitude", "latitude"]].values[None, :],
-                                    vertices,
-                                    row[["longitude", "latitude"]].values[None, :],
-                                ],
-                                axis=0,
-                            ).astype(float)
+                # quadrants are drawn clockwise from NEQ, skipping those with zero radius;
+                # each drawn quadrant spans the next 90 degrees from the storm direction
+                quadrant_radii = track_data[quadrant_names].to_numpy(dtype=float)
+                drawn_quadrants = quadrant_radii > 1
+                record_quadrant_counts = drawn_quadrants.sum(axis=1)
+                drawn_records = record_quadrant_counts > 0
+
+                record_keys = [
+                    f"{record_datetime}:%Y%m%dT%H%M%S"
+                    for record_datetime in track_data["datetime"][drawn_records]
+                ]
 
-                            quadrants.append(Polygon(vertices))
+                track_isotachs = {}
+                if len(record_keys) > 0:
+                    record_indices, quadrant_indices = numpy.nonzero(drawn_quadrants)
+                    quadrant_ranks = (numpy.cumsum(drawn_quadrants, axis=1) - 1)[
+                        record_indices, quadrant_indices
+                    ]
+                    start_angles = (
+                        360 - track_data["direction"].to_numpy(dtype=float)
+                    )[record_indices] + 90 * quadrant_ranks
+                    radii = quadrant_radii[record_indices, quadrant_indices]
+                    centers = track_data[["longitude", "latitude"]].to_numpy(
+                        dtype=float
+                    )[record_indices]
+
+                    # make the coordinate lists for all quadrants with a single forward geodetic call (origin,angle,dist)
+                    x, y, _ = WGS84.fwd(
+                        lons=numpy.repeat(centers[:, 0], segments),
+                        lats=numpy.repeat(centers[:, 1], segments),
+                        az=(start_angles[:, None] + quadrant_angles).ravel(),
+                        dist=numpy.repeat(radii, segments),
+                    )
 
-                    if len(quadrants) > 0:
-                        isotach = ops.unary_union(quadrants)
+                    # insert center point at beginning and end of each quadrant
+                    coordinates = numpy.empty(
+                        (len(centers), segments + 2, 2), dtype=float
+                    )
+                    coordinates[:, 0] = centers
+                    coordinates[:, -1] = centers
+                    coordinates[:, 1:-1, 0] = x.reshape(len(centers), segments)
+                    coordinates[:, 1:-1, 1] = y.reshape(len(centers), segments)
+                    quadrants = shapely.polygons(coordinates)
+
+                    # place the quadrants of each record in a row and merge every row in a single call
+                    record_quadrants = numpy.full(
+                        (len(drawn_quadrants), len(quadrant_names)), None, dtype=object
+                    )
+                    record_quadrants[record_indices, quadrant_ranks] = quadrants
+                    record_isotachs = shapely.union_all(
+                        record_quadrants[drawn_records], axis=1
+                    )
 
-                        if isinstance(isotach, MultiPolygon):
-                            isotach = isotach.buffer(1e-10)
+                    multipolygons = (
+                        shapely.get_type_id(record_isotachs)
+                        == shapely.GeometryType.MULTIPOLYGON
+                    )
+                    record_isotachs[multipolygons] = shapely.buffer(
+                        record_isotachs[multipolygons], 1e-10
+                    )
 
-                        track_isotachs[f'{row["datetime"]}:%Y%m%dT%H%M%S'] = isotach
+                    track_isotachs = dict(zip(record_keys, record_isotachs))
                 if len(track_isotachs) > 0:
                     advisory_isotachs[track_start_time] = track_isotachs
             if len(advisory_isotachs) > 0:
@@ -935,29 +1032,55 @@ class VortexTrack:
 
         isotachs = self.isotachs(wind_speed=wind_speed, segments=segments)
 
-        wind_swaths = {}
+        wind_swaths = {advisory: {} for advisory in isotachs}
+
+        # a swath needs at least two consecutive isotachs
+        keys = []
+        track_isotachs = []
         for advisory, advisory_isotachs in isotachs.items():
-            advisory_wind_swaths = {}
-            for track_start_time, track_isotachs in advisory_isotachs.items():
-                convex_hulls = []
-                isotach_times = list(track_isotachs)
-                for index in range(len(isotach_times) - 1):
-                    convex_hulls.append(
-                        ops.unary_union(
-                            [
-                                track_isotachs[isotach_times[index]],
-                                track_isotachs[isotach_times[index + 1]],
-                            ]
-                        ).convex_hull
-                    )
+            for track_start_time, isotachs_at_times in advisory_isotachs.items():
+                if len(isotachs_at_times) > 1:
+                    keys.append((advisory, track_start_time))
+                    track_isotachs.append(list(isotachs_at_times.values()))
+
+        if len(keys) > 0:
+            track_lengths = [
+                len(isotachs_in_track) for isotachs_in_track in track_isotachs
+            ]
+            track_indices = numpy.repeat(numpy.arange(len(keys)), track_lengths)
+
+            # the hull of two isotachs is the hull of their individual hulls,
+            # which have far fewer vertices than the isotachs themselves
+            isotach_hulls = shapely.convex_hull(
+                numpy.asarray(
+                    [
+                        isotach
+                        for isotachs_in_track in track_isotachs
+                        for isotach in isotachs_in_track
+                    ],
+                    dtype=object,
+                )
+            )
 
-                if len(convex_hulls) > 0:
-                    # get the union of polygons
-                    advisory_wind_swaths[track_start_time] = ops.unary_union(
-                        convex_hulls
-                    )
-            if len(advisory_isotachs) > 0:
-                wind_swaths[advisory] = advisory_wind_swaths
+            # pair every isotach with the next one in the same track and take all pair hulls, of all tracks, in one call
+            pair_indices = numpy.flatnonzero(track_indices[:-1] == track_indices[1:])
+            convex_hulls = shapely.convex_hull(
+                shapely.geometrycollections(
+                    isotach_hulls[
+                        numpy.stack([pair_indices, pair_indices + 1], axis=1).ravel()
+                    ],
+                    indices=numpy.repeat(numpy.arange(len(pair_indices)), 2),
+                )
+            )
+
+            # get the union of polygons of each track
+            track_pair_counts = numpy.array(track_lengths) - 1
+            for (advisory, track_start_time), track_convex_hulls in zip(
+                keys, numpy.split(convex_hulls, numpy.cumsum(track_pair_counts)[:-1])
+            ):
+                wind_swaths[advisory][track_start_time] = shapely.unary_union(
+                    track_convex_hulls
+                )
 
         return wind_swaths
 
@@ -974,7 +1097,15 @@ class VortexTrack:
         :return: duration of current track
         """
 
-        return self.data["datetime"].diff().sum()
+        if self.__duration is None:
+            # consecutive differences add up to the span between the first and last records
+            datetimes = self.__data_column("datetime").values
+            if len(datetimes) > 0:
+                self.__duration = pandas.Timedelta(datetimes[-1] - datetimes[0])
+            else:
+                self.__duration = pandas.Timedelta(0)
+
+        return self.__duration
 
     @property
     def unfiltered_data(self) -> DataFrame:
@@ -984,6 +1115,14 @@ class VortexTrack:
 
         configuration = self.__configuration
 
+        # skip the checks below if nothing has been set since the last access;
+        # NOTE: in-place edits to this data frame are only picked up after assigning it back to `unfiltered_data`
+        if (
+            self.__unfiltered_data_valid
+            and configuration == self.__previous_configuration
+        ):
+            return self.__unfiltered_data
+
         # only proceed if the configuration has changed
         if (
             self.__unfiltered_data is None
@@ -991,33 +1130,71 @@ class VortexTrack:
             or configuration != self.__previous_configuration
         ):
             advisories = self.advisories
-            if configuration["filename"] is not None:
-                atcf_file = configuration["filename"]
+            if "OFCL" in advisories and "CARQ" not in advisories:
+                self.__advisories_to_remove.append(ATCF_Advisory.CARQ)
+            read_advisories = advisories + self.__advisories_to_remove
+
+            # reuse previously parsed data, if caching is enabled
+            advisory_names = sorted(typepigeon.convert_value(read_advisories, [str]))
+            if configuration.filename is not None:
+                # local entries are tied to the exact version of the file, so they do not expire
+                filename = pathlib.Path(configuration.filename).resolve()
+                file_status = filename.stat()
+                file_version = hashlib.sha1(
+                    f"{filename}:{file_status.st_mtime_ns}:{file_status.st_size}".encode()
+                ).hexdigest()
+                cache_key = "_".join([file_version, *advisory_names])
+                cache_lifetime = None
             else:
-                url = atcf_url(self.nhc_code, self.file_deck)
-                try:
-                    response = urlopen(url)
-                except URLError:
-                    url = atcf_url(
-                        self.nhc_code, self.file_deck, mode=ATCF_Mode.HISTORICAL
+                cache_key = "_".join(
+                    [self.nhc_code.upper(), self.file_deck.value, *advisory_names]
+                )
+                cache_lifetime = ATCF_CACHE_LIFETIME
+            dataframe = read_atcf_cache(cache_key, max_age=cache_lifetime)
+
+            if dataframe is None:
+                if configuration.filename is not None:
+                    dataframe = read_atcf(
+                        configuration.filename, advisories=read_advisories
                     )
+                else:
+                    url = atcf_url(self.nhc_code, self.file_deck)
                     try:
                         response = urlopen(url)
                     except URLError:
-                        raise ConnectionError(f"could not connect to {url}")
-                atcf_file = io.BytesIO()
-                atcf_file.write(response.read())
-                atcf_file.seek(0)
-                if url.endswith(".gz"):
-                    atcf_file = gzip.GzipFile(fileobj=atcf_file, mode="rb")
-
-            if "OFCL" in advisories and "CARQ" not in advisories:
-                self.__advisories_to_remove.append(ATCF_Advisory.CARQ)
-
-            dataframe = read_atcf(
-                atcf_file, advisories=advisories + self.__advisories_to_remove
-            )
-            dataframe.sort_values(["datetime", "advisory"], inplace=True)
+                        url = atcf_url(
+                            self.nhc_code, self.file_deck, mode=ATCF_Mode.HISTORICAL
+                        )
+                        try:
+                            response = urlopen(url)
+                        except URLError:
+                            raise ConnectionError(f"could not connect to {url}")
+                    with response:
+                        if url.endswith(".gz"):
+                            # decompress in a single call rather than through a streaming `GzipFile`
+                            atcf_file = io.BytesIO(gzip.decompress(response.read()))
+                        else:
+                            # the parser reads the whole response at once, so it needs no intermediate buffer
+                            atcf_file = response
+
+                        dataframe = read_atcf(atcf_file, advisories=read_advisories)
+                write_atcf_cache(cache_key, dataframe)
+
+            # the few advisory types are compared often, which is cheaper with integer codes
+            dataframe["advisory"] = dataframe["advisory"].astype("category")
+            # other text fields with only a handful of distinct values are stored the same way
+            for column in [
+                "basin",
+                "storm_number",
+                "development_level",
+                "isotach_quadrant_code",
+            ]:
+                dataframe[column] = dataframe[column].astype("category")
+
+            advisory_codes, _ = pandas.factorize(dataframe["advisory"], sort=True)
+            dataframe = dataframe.iloc[
+                numpy.lexsort([advisory_codes, dataframe["datetime"].values])
+            ]
             dataframe.reset_index(inplace=True, drop=True)
 
             dataframe["track_start_time"] = dataframe["datetime"].copy()
@@ -1041,23 +1218,46 @@ class VortexTrack:
             self.__previous_configuration = configuration
 
         # if location values have changed, recompute velocity
-        location_hash = pandas.util.hash_pandas_object(
-            self.__unfiltered_data["geometry"]
+        geometries = numpy.asarray(self.__unfiltered_data["geometry"])
+        locations = DataFrame(
+            numpy.stack([shapely.get_x(geometries), shapely.get_y(geometries)], axis=1),
+            index=self.__unfiltered_data.index,
         )
 
-        if self.__location_hash is None or len(location_hash) != len(
-            self.__location_hash
-        ):
-            updated_locations = ~self.__unfiltered_data.index.isnull()
+        if self.__locations is None or not self.__locations.index.is_unique:
+            updated_locations = numpy.full(len(locations), True)
         else:
-            updated_locations = location_hash != self.__location_hash
-        updated_locations |= pandas.isna(self.__unfiltered_data["speed"])
+            # match records by index, so that added or removed records do not shift the comparison
+            previous_locations = self.__locations.reindex(locations.index).values
+            updated_locations = ~locations.index.isin(self.__locations.index) | ~(
+                (locations.values == previous_locations)
+                | (numpy.isnan(locations.values) & numpy.isnan(previous_locations))
+            ).all(axis=1)
+        updated_locations |= pandas.isna(self.__unfiltered_data["speed"]).values
 
         if updated_locations.any():
-            self.__unfiltered_data.loc[updated_locations] = self.__compute_velocity(
-                self.__unfiltered_data[updated_locations]
+            # velocity depends on the neighboring records, so compute over entire advisories,
+            # but only overwrite the flagged records and keep the velocities supplied by the file
+            updated_advisories = (
+                self.__unfiltered_data["advisory"]
+                .isin(
+                    pandas.unique(
+                        self.__unfiltered_data["advisory"].values[updated_locations]
+                    )
+                )
+                .values
             )
-            self.__location_hash = location_hash
+            velocities = self.__compute_velocity(
+                self.__unfiltered_data[updated_advisories]
+            )
+            self.__unfiltered_data.loc[updated_locations, ["speed", "direction"]] = (
+                velocities.loc[
+                    updated_locations[updated_advisories], ["speed", "direction"]
+                ].values
+            )
+            self.__locations = locations
+
+        self.__unfiltered_data_valid = True
 
         return self.__unfiltered_data
 
@@ -1081,107 +1281,113 @@ class VortexTrack:
             self.__advisories_to_remove = []
 
         self.__unfiltered_data = dataframe
+        self.__unfiltered_data_valid = False
+        self.__data_mask = None
+        self.__duration = None
+        self.__linestrings = None
+        self.__distances = None
 
     @property
-    def __configuration(self) -> Dict[str, Any]:
-        return {
-            "id": self.nhc_code,
-            "file_deck": self.file_deck,
-            "advisories": self.advisories,
-            "filename": self.filename,
-            "rmw_fill": self.rmw_fill,
-        }
+    def __configuration(self) -> _TrackConfiguration:
+        return _TrackConfiguration(
+            self.nhc_code,
+            self.file_deck,
+            tuple(self.advisories),
+            self.filename,
+            self.rmw_fill,
+        )
 
     @staticmethod
     def __compute_velocity(data: DataFrame) -> DataFrame:
-        geodetic = Geod(ellps="WGS84")
-
-        for advisory in pandas.unique(data["advisory"]):
-            advisory_data = data.loc[data["advisory"] == advisory]
-
-            indices = advisory_data.index
-            shifted_indices = numpy.roll(indices, 1)
-            shifted_indices[0] = indices[0]
-
-            # check for negative time shifts which indicate new forecasts
-            # and update this with the last previously available time
-            for counter, ind in enumerate(zip(indices, shifted_indices)):
-                this_time = advisory_data.loc[ind[0], "datetime"]
-                shift_time = advisory_data.loc[ind[1], "datetime"]
-                if shift_time > this_time:
-                    # update shift index
-                    if (advisory_data["datetime"] < this_time).sum() == 0:
-                        shifted_indices[counter] = advisory_data["datetime"][
-                            advisory_data["datetime"] > this_time
-                        ].index[0]
-                    else:
-                        shifted_indices[counter] = advisory_data["datetime"][
-                            advisory_data["datetime"] < this_time
-                        ].index[-1]
-
-            forward_azimuths, inverse_azimuths, distances = geodetic.inv(
-                advisory_data.loc[indices, "longitude"],
-                advisory_data.loc[indices, "latitude"],
-                advisory_data.loc[shifted_indices, "longitude"],
-                advisory_data.loc[shifted_indices, "latitude"],
+        # extract contiguous arrays once, rather than indexing the data frame for every advisory
+        longitudes = data["longitude"].to_numpy(dtype=numpy.float64)
+        latitudes = data["latitude"].to_numpy(dtype=numpy.float64)
+        datetimes = data["datetime"].values
+
+        def advisory_velocity(
+            positions: numpy.ndarray,
+        ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+            previous_positions = positions[
+                _previous_record_positions(datetimes[positions])
+            ]
+
+            forward_azimuths, inverse_azimuths, distances = WGS84.inv(
+                longitudes[positions],
+                latitudes[positions],
+                longitudes[previous_positions],
+                latitudes[previous_positions],
             )
 
             intervals = (
-                (
-                    advisory_data.loc[indices, "datetime"].values
-                    - advisory_data.loc[shifted_indices, "datetime"].values
-                )
+                (datetimes[positions] - datetimes[previous_positions])
                 .astype("timedelta64[s]")
                 .astype(float)
             )
-            speeds = pandas.Series(distances / abs(intervals), index=indices)
-            bearings = pandas.Series(inverse_azimuths % 360, index=indices)
+            speeds = distances / abs(intervals)
             # use forward azimuths for negative intervals
-            bearings[intervals < 0] = pandas.Series(
-                forward_azimuths[intervals < 0] % 360, index=indices[intervals < 0]
+            bearings = (
+                numpy.where(intervals < 0, forward_azimuths, inverse_azimuths) % 360
             )
-            bearings[pandas.isna(speeds)] = numpy.nan
+            bearings[numpy.isnan(speeds)] = numpy.nan
             # fill in nans carrying forward, because it is same valid time
             # and forecast but different isotach.
             # then fill nans backwards to handle the first time
-            speeds.ffill(inplace=True)
-            bearings.ffill(inplace=True)
-            speeds.bfill(inplace=True)
-            bearings.bfill(inplace=True)
-            advisory_data["speed"] = speeds
-            advisory_data["direction"] = bearings
+            velocities = (
+                DataFrame({"speed": speeds, "direction": bearings}).ffill().bfill()
+            )
 
-            data.loc[data["advisory"] == advisory] = advisory_data
+            return (
+                positions,
+                velocities["speed"].values,
+                velocities["direction"].values,
+            )
 
-        return data
+        speeds = data["speed"].values.astype(float)
+        directions = data["direction"].values.astype(float)
 
-    @property
-    def __file_end_date(self):
-        unique_dates = numpy.unique(self.unfiltered_data["datetime"])
-        for date in unique_dates:
-            if date >= numpy.datetime64(self.end_date):
-                return date
+        advisory_positions = data.groupby("advisory", sort=False, observed=True).indices
+        for positions, advisory_speeds, advisory_directions in map(
+            advisory_velocity, advisory_positions.values()
+        ):
+            speeds[positions] = advisory_speeds
+            directions[positions] = advisory_directions
+
+        data["speed"] = speeds
+        data["direction"] = directions
+
+        return data
 
     def __len__(self) -> int:
         return len(self.data)
 
     def __copy__(self) -> "VortexTrack":
-        instance = self.__class__(
-            storm=self.unfiltered_data.copy(),
-            start_date=self.start_date,
-            end_date=self.end_date,
-            file_deck=self.file_deck,
-            advisories=self.advisories,
-        )
-        if self.filename is not None:
-            instance.filename = self.filename
+        unfiltered_data = self.unfiltered_data
+
+        # carry over the current state, so the copy does not reread the file or recompute velocities
+        instance = self.__class__.__new__(self.__class__)
+        instance.__dict__.update(self.__dict__)
+
+        # velocities are written into the data frame in place, so it cannot be shared
+        instance.__unfiltered_data = unfiltered_data.copy()
+        instance.__advisories_to_remove = list(self.__advisories_to_remove)
+        # derived geometries are rebuilt for the copy, since its time window may be changed independently
+        instance.__linestrings = None
+        instance.__distances = None
+
         return instance
 
     def __eq__(self, other: "VortexTrack") -> bool:
         return self.data.equals(other.data)
 
     def __str__(self) -> str:
-        return f'{self.nhc_code} ({" + ".join(pandas.unique(self.data["advisory"]).tolist())}) track with {len(self)} entries, spanning {self.distances:.2f} meters over {self.duration}'
+        data = self.data
+        advisories = " + ".join(pandas.unique(data["advisory"]).tolist())
+        distance = sum(
+            distance
+            for advisory_distances in self.distances.values()
+            for distance in advisory_distances.values()
+        )
+        return f"{self.nhc_code} ({advisories}) track with {len(data)} entries, spanning {distance:.2f} meters over {self.duration}"
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({", ".join(repr(value) for value in [self.nhc_code, self.start_date, self.end_date, self.file_deck, self.advisories, self.filename])})'
@@ -1226,6 +1432,43 @@ class HollandBRelation:
         )
 
 
+def _previous_record_positions(datetimes: numpy.ndarray) -> numpy.ndarray:
+    """
+    positions of the record preceding each record, for computing velocity;
+    negative time shifts indicate new forecasts, so these records use the last record before that time
+    (or the first record after that time, if there is no earlier record)
+
+    :param datetimes: record datetimes, in record order
+    :return: position of preceding record for each record
+    """
+
+    positions = numpy.arange(len(datetimes))
+    previous_positions = numpy.maximum(positions - 1, 0)
+
+    new_forecasts = datetimes[previous_positions] > datetimes
+    if new_forecasts.any():
+        order = numpy.argsort(datetimes, kind="stable")
+        sorted_datetimes = datetimes[order]
+        # last position of any earlier time, and first position of any later time
+        last_earlier_positions = numpy.maximum.accumulate(order)
+        first_later_positions = numpy.minimum.accumulate(order[::-1])[::-1]
+
+        new_forecast_datetimes = datetimes[new_forecasts]
+        num_earlier = numpy.searchsorted(
+            sorted_datetimes, new_forecast_datetimes, side="left"
+        )
+        num_not_later = numpy.searchsorted(
+            sorted_datetimes, new_forecast_datetimes, side="right"
+        )
+        previous_positions[new_forecasts] = numpy.where(
+            num_earlier > 0,
+            last_earlier_positions[num_earlier - 1],
+            first_later_positions[numpy.minimum(num_not_later, len(datetimes) - 1)],
+        )
+
+    return previous_positions
+
+
 def separate_tracks(data: DataFrame) -> Dict[str, Dict[str, DataFrame]]:
     """
     separate the given track data frame into advisories and tracks (forecasts / hindcasts)
@@ -1,12 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from datetime import datetime
 from datetime import timedelta
 from enum import Enum
-from functools import lru_cache
+from functools import cached_property
 from os import PathLike
 from typing import List
 
 import geopandas as gpd
 import pandas
+import shapely
 import xarray
 from searvey.coops import COOPS_Interval
 from searvey.coops import COOPS_Product
@@ -16,7 +19,6 @@ from searvey.coops import COOPS_TidalDatum
 from searvey.coops import COOPS_TimeZone
 from searvey.coops import COOPS_Units
 from searvey.coops import StationStatus
-from shapely import ops
 from shapely.geometry import MultiPolygon
 from shapely.geometry import Polygon
 from shapely.geometry.base import BaseGeometry
@@ -33,6 +35,9 @@ from stormevents.usgs import USGS_StormEvent
 from stormevents.utilities import relative_to_time_interval
 from stormevents.utilities import subset_time_interval
 
+# number of CO-OPS stations requested at the same time
+_COOPS_MAX_CONCURRENCY = 5
+
 
 class StormStatus(Enum):
     HISTORICAL = "historical"
@@ -75,7 +80,7 @@ class StormEvent:
         """
 
         storms = nhc_storms(year=year)
-        storms = storms[storms["name"].str.fullmatch(name.upper())]
+        storms = storms[storms["name"] == name.upper()]
         if len(storms) > 0:
             self.__entry = storms.iloc[0]
         else:
@@ -84,7 +89,6 @@ class StormEvent:
         self.__usgs_id = None
         self.__is_usgs_flood_event = True
         self.__high_water_marks = None
-        self.__previous_configuration = {"name": self.name, "year": self.year}
 
         self.start_date = start_date
         self.end_date = end_date
@@ -112,7 +116,7 @@ class StormEvent:
 
         storms = nhc_storms(year=year)
 
-        if nhc_code.upper() not in storms.index.values:
+        if nhc_code.upper() not in storms.index:
             raise ValueError(f'NHC code "{nhc_code}" does not exist in table')
 
         storm = storms.loc[nhc_code]
@@ -179,22 +183,22 @@ class StormEvent:
         if self.__usgs_id is None and self.__is_usgs_flood_event:
             storms = usgs_flood_storms(year=self.year)
 
-            if self.nhc_code in storms.index.values:
+            if self.nhc_code in storms.index:
                 usgs_storm_event = storms.loc[self.nhc_code]
                 self.__usgs_id = usgs_storm_event["usgs_id"]
             else:
                 self.__is_usgs_flood_event = False
         return self.__usgs_id
 
-    @property
+    @cached_property
     def name(self) -> str:
         return self.__entry["name"].strip()
 
-    @property
+    @cached_property
     def year(self) -> int:
         return self.__entry["year"]
 
-    @property
+    @cached_property
     def basin(self) -> str:
         """
         :return: basin in which storm occurred
@@ -202,7 +206,7 @@ class StormEvent:
 
         return self.__entry["basin"].strip()
 
-    @property
+    @cached_property
     def number(self) -> int:
         """
         :return: ordinal number of storm in the year
@@ -227,12 +231,11 @@ class StormEvent:
             )
         self.__start_date = start_date
 
-    @property
-    @lru_cache(maxsize=None)
+    @cached_property
     def __data_start(self) -> datetime:
         data_start = self.__entry["start_date"]
         if pandas.isna(data_start):
-            data_start = VortexTrack.from_storm_name(self.name, self.year).start_date
+            data_start = self.__default_track.start_date
         return data_start
 
     @property
@@ -252,14 +255,18 @@ class StormEvent:
             )
         self.__end_date = end_date
 
-    @property
-    @lru_cache(maxsize=None)
+    @cached_property
     def __data_end(self) -> datetime:
         data_end = self.__entry["end_date"]
         if pandas.isna(data_end):
-            data_end = VortexTrack.from_storm_name(self.name, self.year).end_date
+            data_end = self.__default_track.end_date
         return data_end
 
+    @cached_property
+    def __default_track(self) -> VortexTrack:
+        # downloaded once, then shared by the data bounds and copied by `track()` for historical storms
+        return VortexTrack.from_storm_name(self.name, self.year)
+
     @property
     def status(self) -> StormStatus:
         entry = self.__entry
@@ -283,7 +290,8 @@ class StormEvent:
         rmw_fill: RMWFillMethod = RMWFillMethod.regression_penny_2023,
     ) -> VortexTrack:
         """
-        retrieve NHC ATCF track data
+        retrieve NHC ATCF track data; the default track of a historical storm with a known end date is downloaded once and
+        copied on later calls, while other storms are downloaded on every call to pick up new advisories
 
         :param start_date: start date
         :param end_date: end date
@@ -304,6 +312,17 @@ class StormEvent:
 
         if filename is not None:
             track = VortexTrack.from_file(filename)
+        elif (
+            not pandas.isna(self.__entry["end_date"])
+            and self.status == StormStatus.HISTORICAL
+            and file_deck is None
+            and advisories is None
+            and forecast_time is None
+            and rmw_fill == RMWFillMethod.regression_penny_2023
+        ):
+            track = copy(self.__default_track)
+            track.start_date = start_date
+            track.end_date = end_date
         else:
             track = VortexTrack.from_storm_name(
                 name=self.name,
@@ -341,11 +360,8 @@ class StormEvent:
         [644 rows x 53 columns]
         """
 
-        configuration = {"name": self.name, "year": self.year}
-        if (
-            self.__high_water_marks is None
-            or configuration != self.__previous_configuration
-        ):
+        # the storm entry cannot change after construction, so the flood event only needs to be created once
+        if self.__high_water_marks is None:
             self.__high_water_marks = USGS_StormEvent(name=self.name, year=self.year)
         return self.__high_water_marks
 
@@ -408,11 +424,14 @@ class StormEvent:
                 advisories=advisories,
             )
 
-        polygons = []
-        wind_swaths = track.wind_swaths(wind_speed)
-        for advisory, advisory_wind_swaths in wind_swaths.items():
-            polygons.append(ops.unary_union(list(advisory_wind_swaths.values())))
-        region = ops.unary_union(polygons)
+        # merge the swaths of all advisories in a single union
+        region = shapely.union_all(
+            [
+                wind_swath
+                for advisory_wind_swaths in track.wind_swaths(wind_speed).values()
+                for wind_swath in advisory_wind_swaths.values()
+            ]
+        )
 
         return self.coops_product_within_region(
             region=region,
@@ -496,18 +515,38 @@ class StormEvent:
             )
 
         if len(stations) > 0:
-            stations_data = []
-            for station in stations.index:
-                station_data = COOPS_Station(station).product(
+
+            def station_product(station: COOPS_Station) -> Dataset:
+                return station.product(
                     product=product,
                     start_date=start_date,
                     end_date=end_date,
                     interval=interval,
                     datum=datum,
                 )
-                if len(station_data["t"]) > 0:
-                    stations_data.append(station_data)
-            stations_data = xarray.combine_nested(stations_data, concat_dim="nos_id")
+
+            # stations look up the full station table, so create them before any threads start,
+            # to load and parse the table only once
+            coops_stations = [COOPS_Station(station) for station in stations.index]
+
+            # requests are I/O-bound, so issue a few at a time; `map` keeps the station order
+            with ThreadPoolExecutor(max_workers=_COOPS_MAX_CONCURRENCY) as executor:
+                stations_data = [
+                    station_data
+                    for station_data in executor.map(station_product, coops_stations)
+                    if len(station_data["t"]) > 0
+                ]
+            if len(stations_data) > 0:
+                # every station variable lies along `nos_id`, so nothing else needs to be compared
+                stations_data = xarray.concat(
+                    stations_data,
+                    dim="nos_id",
+                    join="outer",
+                    coords="minimal",
+                    compat="override",
+                )
+            else:
+                stations_data = Dataset()
         else:
             stations_data = Dataset(
                 coords={"t": None, "nos_id": None, "nws_id": None, "x": None, "y": None}
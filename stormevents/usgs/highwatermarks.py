@@ -1,7 +1,11 @@
+from datetime import datetime
+from datetime import timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Tuple
 
 import geopandas
 import pandas
@@ -13,6 +17,9 @@ from pandas import DataFrame
 from stormevents.usgs.base import EventStatus
 from stormevents.usgs.base import EventType
 
+# downloaded high-water marks are refreshed after this time, since ongoing events are still being surveyed
+HWM_CACHE_LIFETIME = timedelta(hours=1)
+
 
 class HighWaterMarkType(Enum):
     """
@@ -51,6 +58,9 @@ class HighWaterMarksQuery:
     """
     abstraction of an individual query to the USGS Short-Term Network API for high-water marks (HWMs)
     https://stn.wim.usgs.gov/STNServices/Documentation/home
+
+    downloaded HWMs are shared between queries with the same parameters for up to an hour (``HWM_CACHE_LIFETIME``),
+    after which they are downloaded again
     """
 
     URL = "https://stn.wim.usgs.gov/STNServices/HWMs/FilteredHWMs.json"
@@ -250,82 +260,22 @@ class HighWaterMarksQuery:
             else:
                 url = "https://stn.wim.usgs.gov/STNServices/HWMs.json"
 
-            response = requests.get(url, params=query)
-
-            if response.status_code == 200:
-                data = DataFrame(response.json())
-                self.__error = None
-            else:
-                self.__error = f"{response.reason} - {response.request.url}"
-                raise ValueError(self.__error)
-
-            if len(data) > 0:
-                data["survey_date"] = pandas.to_datetime(
-                    data["survey_date"], errors="coerce"
+            try:
+                # responses are shared between queries with the same parameters within the cache lifetime
+                data = _high_water_marks(
+                    url,
+                    tuple(query.items()),
+                    int(
+                        datetime.now().timestamp() // HWM_CACHE_LIFETIME.total_seconds()
+                    ),
                 )
-                data["flag_date"] = pandas.to_datetime(
-                    data["flag_date"], errors="coerce"
-                )
-                data.loc[data["markerName"].str.len() == 0, "markerName"] = None
-            else:
-                data = DataFrame(
-                    columns=[
-                        "latitude",
-                        "longitude",
-                        "eventName",
-                        "hwmTypeName",
-                        "hwmQualityName",
-                        "verticalDatumName",
-                        "verticalMethodName",
-                        "approvalMember",
-                        "markerName",
-                        "horizontalMethodName",
-                        "horizontalDatumName",
-                        "flagMemberName",
-                        "surveyMemberName",
-                        "site_no",
-                        "siteDescription",
-                        "sitePriorityName",
-                        "networkNames",
-                        "stateName",
-                        "countyName",
-                        "siteZone",
-                        "sitePermHousing",
-                        "site_latitude",
-                        "site_longitude",
-                        "hwm_id",
-                        "waterbody",
-                        "site_id",
-                        "event_id",
-                        "hwm_type_id",
-                        "hwm_quality_id",
-                        "latitude_dd",
-                        "longitude_dd",
-                        "survey_date",
-                        "elev_ft",
-                        "vdatum_id",
-                        "vcollect_method_id",
-                        "bank",
-                        "marker_id",
-                        "hcollect_method_id",
-                        "hwm_notes",
-                        "hwm_environment",
-                        "flag_date",
-                        "stillwater",
-                        "hdatum_id",
-                        "hwm_label",
-                        "files",
-                        "height_above_gnd",
-                        "hwm_locationdescription",
-                        "flag_member_id",
-                        "survey_member_id",
-                    ],
-                )
-            data.set_index("hwm_id", inplace=True)
-            self.__data = GeoDataFrame(
-                data,
-                geometry=geopandas.points_from_xy(data["longitude"], data["latitude"]),
-            )
+            except ValueError as error:
+                self.__error = str(error)
+                raise
+            self.__error = None
+
+            # the cached data frame is shared, so hand out a copy that can be modified
+            self.__data = data.copy()
             self.__previous_query = query
         elif self.__error is not None:
             raise ValueError(self.__error)
@@ -350,3 +300,88 @@ class HighWaterMarksQuery:
             f"still_water={self.still_water}"
             f")"
         )
+
+
+@lru_cache(maxsize=32)
+def _high_water_marks(
+    url: str, query: Tuple[Tuple[str, Any], ...], period: int
+) -> GeoDataFrame:
+    """
+    request high-water marks from the USGS Short-Term Network API
+
+    :param url: API endpoint
+    :param query: query parameters, as key-value pairs
+    :param period: index of the current cache lifetime period; cached responses from earlier periods are not reused
+    :return: data frame of high-water marks
+    """
+
+    response = requests.get(url, params=dict(query))
+
+    if response.status_code == 200:
+        data = DataFrame(response.json())
+    else:
+        raise ValueError(f"{response.reason} - {response.request.url}")
+
+    if len(data) > 0:
+        data["survey_date"] = pandas.to_datetime(data["survey_date"], errors="coerce")
+        data["flag_date"] = pandas.to_datetime(data["flag_date"], errors="coerce")
+        data.loc[data["markerName"].str.len() == 0, "markerName"] = None
+    else:
+        data = DataFrame(
+            columns=[
+                "latitude",
+                "longitude",
+                "eventName",
+                "hwmTypeName",
+                "hwmQualityName",
+                "verticalDatumName",
+                "verticalMethodName",
+                "approvalMember",
+                "markerName",
+                "horizontalMethodName",
+                "horizontalDatumName",
+                "flagMemberName",
+                "surveyMemberName",
+                "site_no",
+                "siteDescription",
+                "sitePriorityName",
+                "networkNames",
+                "stateName",
+                "countyName",
+                "siteZone",
+                "sitePermHousing",
+                "site_latitude",
+                "site_longitude",
+                "hwm_id",
+                "waterbody",
+                "site_id",
+                "event_id",
+                "hwm_type_id",
+                "hwm_quality_id",
+                "latitude_dd",
+                "longitude_dd",
+                "survey_date",
+                "elev_ft",
+                "vdatum_id",
+                "vcollect_method_id",
+                "bank",
+                "marker_id",
+                "hcollect_method_id",
+                "hwm_notes",
+                "hwm_environment",
+                "flag_date",
+                "stillwater",
+                "hdatum_id",
+                "hwm_label",
+                "files",
+                "height_above_gnd",
+                "hwm_locationdescription",
+                "flag_member_id",
+                "survey_member_id",
+            ],
+        )
+    data.set_index("hwm_id", inplace=True)
+    return GeoDataFrame(
+        data,
+        geometry=geopandas.points_from_xy(data["longitude"], data["latitude"]),
+    )
@@ -6,6 +6,8 @@ from stormevents.nhc.atcf import atcf_files
 from stormevents.nhc.atcf import ATCF_Mode
 from stormevents.nhc.atcf import atcf_url
 from stormevents.nhc.atcf import get_atcf_entry
+from stormevents.nhc.atcf import read_atcf
+from tests import INPUT_DIRECTORY
 
 
 def test_atcf_url():
@@ -59,3 +61,24 @@ def test_atcf_entry():
 
     assert storm_1["name"] == "FLORENCE"
     assert storm_2["basin"] == "AL" and storm_2["number"] == 6
+
+
+def test_read_atcf_time_window():
+    path = INPUT_DIRECTORY / "test_vortex_track_no_internet" / "fort.22"
+
+    data = read_atcf(path)
+    window = read_atcf(path, start_date="2018-09-12", end_date="2018-09-14")
+
+    assert window["datetime"].min() == datetime(2018, 9, 12)
+    assert window["datetime"].max() == datetime(2018, 9, 14)
+    assert (
+        len(window)
+        == (
+            (data["datetime"] >= datetime(2018, 9, 12))
+            & (data["datetime"] <= datetime(2018, 9, 14))
+        ).sum()
+    )
+    assert len(read_atcf(data, start_date="2018-09-12", end_date="2018-09-14")) == len(
+        window
+    )
+    assert read_atcf(data) is data
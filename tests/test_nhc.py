@@ -7,6 +7,8 @@ import pytest
 from pytest_socket import SocketBlockedError
 
 import stormevents
+from stormevents.nhc.atcf import read_atcf
+from stormevents.nhc.atcf import write_atcf_cache
 from stormevents.nhc.storms import nhc_storms
 from stormevents.nhc.storms import nhc_storms_gis_archive
 from stormevents.nhc.track import VortexTrack
@@ -277,6 +279,94 @@ def test_vortex_track_no_internet():
     check_reference_directory(output_directory, reference_directory)
 
 
+@pytest.mark.disable_socket
+def test_vortex_track_copy_time_window():
+    track = VortexTrack.from_file(
+        INPUT_DIRECTORY / "test_vortex_track_no_internet" / "fort.22", file_deck="b"
+    )
+    linestrings = track.linestrings
+    distances = track.distances
+
+    track_copy = copy(track)
+    track_copy.start_date = track.data["datetime"].iloc[len(track) // 2]
+
+    (copy_linestring,) = track_copy.linestrings["BEST"].values()
+    assert len(copy_linestring.coords) == len(track_copy.data["datetime"].unique())
+    assert track_copy.distances["BEST"] != distances["BEST"]
+
+    # the original track is unaffected
+    assert track.linestrings == linestrings
+    assert track.distances == distances
+
+
+@pytest.mark.disable_socket
+def test_vortex_track_partially_blank_speed(tmp_path):
+    input_filename = INPUT_DIRECTORY / "test_vortex_track_no_internet" / "fort.22"
+
+    # blank out the storm speed of a single record
+    lines = input_filename.read_text().splitlines()
+    fields = lines[10].split(",")
+    fields[26] = "    "
+    lines[10] = ",".join(fields)
+    filename = tmp_path / "fort.22"
+    filename.write_text("\n".join(lines) + "\n")
+
+    reference_track = VortexTrack.from_file(input_filename, file_deck="b")
+    track = VortexTrack.from_file(filename, file_deck="b")
+
+    reference_velocities = reference_track.data[["speed", "direction"]].values
+    velocities = track.data[["speed", "direction"]].values
+
+    # only the blank record is computed, the other records keep the values from the file
+    blank = numpy.arange(len(velocities)) == 10
+    assert numpy.array_equal(velocities[~blank], reference_velocities[~blank])
+    assert not numpy.isnan(velocities[blank]).any()
+
+
+@pytest.mark.disable_socket
+def test_vortex_track_cache(monkeypatch, tmp_path):
+    input_directory = INPUT_DIRECTORY / "test_vortex_track_no_internet"
+
+    monkeypatch.setenv("STORMEVENTS_CACHE", str(tmp_path))
+
+    with pytest.raises((ConnectionError, SocketBlockedError)):
+        VortexTrack(storm="AL062018", file_deck="b")
+
+    write_atcf_cache(
+        "AL062018_b_BEST", read_atcf(input_directory / "fort.22", advisories=["BEST"])
+    )
+
+    track = VortexTrack(storm="AL062018", file_deck="b")
+
+    assert (tmp_path / "AL062018_b_BEST.pkl").exists()
+    assert track.nhc_code == "AL062018"
+
+    file_track = VortexTrack.from_file(input_directory / "fort.22", file_deck="b")
+    cached_file_track = VortexTrack.from_file(
+        input_directory / "fort.22", file_deck="b"
+    )
+
+    assert len(list(tmp_path.glob("*_BEST.pkl"))) == 2
+    assert len(track) == len(file_track)
+    assert cached_file_track == file_track
+
+
+@pytest.mark.disable_socket
+def test_vortex_track_corrupt_cache(monkeypatch, tmp_path):
+    filename = INPUT_DIRECTORY / "test_vortex_track_no_internet" / "fort.22"
+
+    monkeypatch.setenv("STORMEVENTS_CACHE", str(tmp_path))
+
+    track = VortexTrack.from_file(filename, file_deck="b")
+
+    # truncate the cache entry, as an interrupted write would
+    (cache_filename,) = tmp_path.glob("*_BEST.pkl")
+    cache_filename.write_bytes(cache_filename.read_bytes()[:100])
+
+    assert VortexTrack.from_file(filename, file_deck="b") == track
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
 def test_vortex_track_forecast_time_init_arg():
     # Test __init__ to accept forecast_time argument
     track = VortexTrack(